@@ -2,6 +2,8 @@ import asyncio
 import logging
 import mimetypes
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from urllib.parse import quote
@@ -9,7 +11,7 @@ from urllib.parse import quote
 import httpx
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response
 
 from ripraven import create_ripraven_router
 from backend.pp import router as pp_router
@@ -22,14 +24,22 @@ log = logging.getLogger("sheggle.email_poll")
 
 POLL_INTERVAL = int(os.environ.get("EMAIL_POLL_INTERVAL", "60"))
 PP_API_KEY = os.environ.get("PP_API_KEY", "pp-dev-key-change-me")
+# Threads behind asyncio.to_thread / run_in_executor. The stdlib default is
+# cpu_count + 4, which on a small VPS caps ripraven's SSHFS stats and reads at a
+# handful in flight while each one mostly waits on the network.
+IO_THREADS = int(os.environ.get("IO_THREADS", "32"))
 
 
 async def _email_poll_loop():
     """Poll Gmail for new Overduyn house emails every POLL_INTERVAL seconds."""
     await asyncio.sleep(10)  # let the app start up
-    while True:
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+    # One client for the life of the loop: building an AsyncClient sets up a
+    # fresh SSL context and pool each time, which dwarfs a localhost POST.
+    # The loop only ever has one request in flight.
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        while True:
+            try:
                 resp = await client.post(
                     "http://127.0.0.1:8000/api/pp/houses/check-email",
                     headers={"X-PP-Key": PP_API_KEY},
@@ -37,13 +47,16 @@ async def _email_poll_loop():
                 data = resp.json()
                 if data.get("ingested", 0) > 0:
                     log.info(f"Ingested {data['ingested']} new house(s)")
-        except Exception as e:
-            log.warning(f"Email poll error: {e}")
-        await asyncio.sleep(POLL_INTERVAL)
+            except Exception as e:
+                log.warning(f"Email poll error: {e}")
+            await asyncio.sleep(POLL_INTERVAL)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=IO_THREADS, thread_name_prefix="io")
+    )
     task = asyncio.create_task(_email_poll_loop())
     if ripraven_api is not None:
         try:
@@ -57,6 +70,8 @@ async def lifespan(app: FastAPI):
             await ripraven_api.stop_worker()
         except Exception:
             pass
+        ripraven_api.flush_recent_chapters()
+        ripraven_api.series_index.flush()
 
 
 app = FastAPI(title="Sheggle Backend", version="0.1.0", lifespan=lifespan)
@@ -78,6 +93,9 @@ ripraven_downloads_dir = project_root / "data" / "ripraven" / "downloads"
 ripraven_router = create_ripraven_router(downloads_dir=ripraven_downloads_dir)
 ripraven_api = getattr(ripraven_router, "ripraven_api", None)
 ripraven_static_dir = project_root / "ripraven" / "static"
+# Resolved once; per-request containment is a string prefix check.
+ripraven_static_root = os.path.realpath(ripraven_static_dir)
+ripraven_static_prefix = ripraven_static_root + os.sep
 ripraven_page = frontend_dir / "rip_raven.html"
 
 # Include RipRaven routes under /api/ripraven
@@ -97,39 +115,46 @@ app.include_router(gmail_router, prefix="/api/tools/gmail")
 app.include_router(whatsapp_router, prefix="/api/tools/whatsapp")
 
 
-def _ripraven_home_response() -> HTMLResponse:
+def _ripraven_home_response(request: Request) -> Response:
     if ripraven_api is not None:
-        return HTMLResponse(ripraven_api.get_home_html())
+        return ripraven_api.get_home_response(request)
     if ripraven_page.exists():
         return FileResponse(ripraven_page)
     raise HTTPException(status_code=500, detail="RipRaven home template missing")
 
 
-def _ripraven_reader_response() -> HTMLResponse:
+def _ripraven_reader_response(request: Request) -> Response:
     if ripraven_api is not None:
-        return HTMLResponse(ripraven_api.get_reader_html())
+        return ripraven_api.get_reader_response(request)
     if ripraven_page.exists():
         return FileResponse(ripraven_page)
     raise HTTPException(status_code=500, detail="RipRaven reader template missing")
 
 
 @app.get("/ripraven")
-def ripraven_root():
-    return _ripraven_home_response()
+def ripraven_root(request: Request):
+    return _ripraven_home_response(request)
 
 
 def _ripraven_static_response(file_path: str) -> FileResponse:
     """Serve RipRaven static assets from the package directory."""
-    static_root = ripraven_static_dir.resolve()
-    target = (static_root / file_path).resolve()
-    try:
-        target.relative_to(static_root)
-    except ValueError:
+    target = os.path.realpath(os.path.join(ripraven_static_root, file_path))
+    if not target.startswith(ripraven_static_prefix):
         raise HTTPException(status_code=403, detail="Access denied")
-    if not target.exists() or not target.is_file():
+    try:
+        is_file = stat.S_ISREG(os.stat(target).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
         raise HTTPException(status_code=404, detail="RipRaven asset not found")
-    media_type, _ = mimetypes.guess_type(str(target))
-    return FileResponse(target, media_type=media_type or "application/octet-stream")
+    media_type, _ = mimetypes.guess_type(target)
+    # Same policy as the API's StaticFiles mount: the reader JS/CSS change on
+    # deploy, so browsers must revalidate rather than reuse a heuristic copy.
+    return FileResponse(
+        target,
+        media_type=media_type or "application/octet-stream",
+        headers={"Cache-Control": "no-cache, must-revalidate"},
+    )
 
 
 @app.get("/ripraven/static/{file_path:path}", include_in_schema=False)
@@ -138,10 +163,10 @@ def ripraven_static(file_path: str):
 
 
 @app.get("/ripraven/{series_name}")
-def ripraven_series(series_name: str, chapter: str | None = None):
+def ripraven_series(series_name: str, request: Request, chapter: str | None = None):
     if chapter is not None:
-        return _ripraven_reader_response()
-    return _ripraven_home_response()
+        return _ripraven_reader_response(request)
+    return _ripraven_home_response(request)
 
 
 @app.get("/ripraven/{series_name}/{chapter_num}")
@@ -151,8 +176,8 @@ def ripraven_series_chapter(series_name: str, chapter_num: str):
 
 
 @app.get("/ripraven/", include_in_schema=False)
-def ripraven_root_with_slash():
-    return _ripraven_home_response()
+def ripraven_root_with_slash(request: Request):
+    return _ripraven_home_response(request)
 
 
 def _is_chapter_number(s: str) -> bool:
@@ -167,12 +192,12 @@ def _is_chapter_number(s: str) -> bool:
 @app.get("/ripraven/{remaining_path:path}", include_in_schema=False)
 def ripraven_catch_all(remaining_path: str, request: Request, chapter: str | None = None):
     if chapter is not None:
-        return _ripraven_reader_response()
+        return _ripraven_reader_response(request)
     parts = [p for p in remaining_path.split("/") if p]
     if len(parts) >= 2 and _is_chapter_number(parts[-1]):
         encoded = quote(parts[-2], safe="")
         return RedirectResponse(url=f"/ripraven/{encoded}?chapter={parts[-1]}", status_code=307)
-    return _ripraven_home_response()
+    return _ripraven_home_response(request)
 
 
 def _frontend_file(filename: str) -> FileResponse:
@@ -0,0 +1,77 @@
+"""Page files on disk: atomic writes and the per-chapter dimensions sidecar.
+
+Pages of an incomplete chapter are served while the chapter is still being
+written, so both chapter writers — the scraper worker and the userscript
+upload handler — go through `write_page`, which never exposes a partially
+written file under a page's name.
+
+The reader sends each page's pixel size so the browser can reserve its box
+before the image arrives. Measuring on the reader's request path meant one
+SSHFS read per page on a chapter's first view, so the sizes are recorded by
+the writers, which already hold each page's bytes. The reader only reads the
+sidecar; chapters written before it existed simply have no sizes.
+
+Sidecar (`<chapter dir>/dimensions.json`): {page file: [width, height]}.
+"""
+
+import io
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+# Not an image extension, so the page listers skip it like the completion
+# marker.
+PAGE_DIMENSIONS_FILE = "dimensions.json"
+
+
+def write_page(path: Path, data: bytes):
+    """Write a page via a temp file + rename, so readers see all or nothing."""
+    # ".tmp" isn't an image extension, so the page listers skip it.
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def image_size(data: bytes) -> Optional[List[int]]:
+    """[width, height] from an image's header; None if Pillow can't tell."""
+    # Imported on first use: only chapter writers need Pillow, and it
+    # only parses the header here, never the pixels.
+    from PIL import Image
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            return list(img.size)
+    except Exception:
+        return None
+
+
+def read_dimensions(chapter_dir: str | Path) -> Dict[str, List[int]]:
+    try:
+        with open(os.path.join(chapter_dir, PAGE_DIMENSIONS_FILE), 'rb') as f:
+            dims = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    # A hand-edited or foreign file mustn't take the reader feed down.
+    return dims if isinstance(dims, dict) else {}
+
+
+def save_dimensions(chapter_dir: str | Path, dims: Dict[str, List[int]]):
+    """Merge `dims` into the chapter's sidecar (a resumed chapter keeps the
+    sizes recorded by the earlier attempt)."""
+    if not dims:
+        return
+    merged = read_dimensions(chapter_dir)
+    merged.update(dims)
+    sidecar = os.path.join(chapter_dir, PAGE_DIMENSIONS_FILE)
+    try:
+        tmp = f"{sidecar}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(merged))
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.warning("⚠️ Could not save page dimensions for %s: %s", chapter_dir, e)
@@ -8,6 +8,7 @@ fetching now happen client-side via the Tampermonkey userscript at
 on-disk chapter list cache that the userscript writes into.
 """
 
+import functools
 import json
 import logging
 import re
@@ -31,6 +32,15 @@ def parse_chapter_url(url: str) -> Optional[dict]:
 
     Fractional chapter slugs use hyphen form (``chapter-1-1`` for 1.1).
     """
+    parsed = _parse_chapter_url_cached(url)
+    # Hand out a copy so callers can't mutate the memoized entry.
+    return dict(parsed) if parsed else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_chapter_url_cached(url: str) -> Optional[dict]:
+    # Pure on the URL string, so repeat /track calls for the same chapter
+    # (retries, re-imports) skip the urlparse + regex work.
     path = urlparse(url).path
     m = CHAPTER_URL_RE.search(path)
     if not m:
@@ -14,7 +14,9 @@ import shutil
 from pathlib import Path
 from typing import List, Optional
 
-from patchright.async_api import async_playwright, BrowserContext, Page
+from patchright.async_api import async_playwright, BrowserContext, Error as PlaywrightError, Page
+
+from .pages import image_size, save_dimensions, write_page
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +35,11 @@ IMAGE_FETCH_ATTEMPTS = 3
 IMAGE_CONCURRENCY = 3
 
 
+_DIGITS_SPLIT = re.compile(r'(\d+)').split
+
+
 def _natural_sort_key(text: str):
-    return [int(p) if p.isdigit() else p.lower() for p in re.split(r'(\d+)', text)]
+    return [int(p) if p.isdigit() else p.lower() for p in _DIGITS_SPLIT(text)]
 
 
 class CFScraper:
@@ -106,35 +111,41 @@ class CFScraper:
         assert self._page
         try:
             await self._page.goto(url, timeout=30_000, wait_until='domcontentloaded')
-        except Exception as e:
+        except PlaywrightError as e:
             logger.warning("goto failed: %s", e)
         for i in range(20):
             await self._page.wait_for_timeout(800)
             try:
                 title = await self._page.title()
-            except Exception:
+            except PlaywrightError as e:
+                logger.debug("title() failed at %s: %s", url, e)
                 title = ''
             if 'Just a moment' not in title and title.strip():
                 # Sanity-check: was this actually a chapter / series page?
                 try:
                     html = await self._page.content()
-                except Exception:
+                except PlaywrightError as e:
+                    logger.debug("content() failed at %s: %s", url, e)
                     html = ''
-                if IMAGE_URL_RE.search(html) or 'ravenscans-content' in html or 'wp-content' in html:
+                # Plain substring probes first: they're C-level scans that
+                # hit on nearly every real page, so the regex only runs on
+                # the rare page that has neither marker.
+                if 'wp-content' in html or 'ravenscans-content' in html or IMAGE_URL_RE.search(html):
                     return True
                 logger.warning("🦅 cf-scraper: title cleared (%r) but content looks blocked at %s", title, url)
                 return False
             try:
                 await self._page.mouse.move(100 + i * 5, 200 + i * 3)
-            except Exception:
-                pass
+            except PlaywrightError as e:
+                logger.debug("mouse.move failed at %s: %s", url, e)
             if i == 4:
                 try:
                     fr = self._page.frame_locator('iframe[src*="challenges.cloudflare.com"]')
                     await fr.locator('input[type=checkbox]').click(timeout=3000)
                     logger.info("🦅 cf-scraper: clicked Turnstile at %s", url)
-                except Exception:
-                    pass
+                except PlaywrightError as e:
+                    # No Turnstile iframe on the page is the common case.
+                    logger.debug("Turnstile click skipped at %s: %s", url, e)
         logger.warning("🦅 cf-scraper: could not solve challenge at %s", url)
         return False
 
@@ -215,6 +226,7 @@ class CFScraper:
 
             save_dir.mkdir(parents=True, exist_ok=True)
             sem = asyncio.Semaphore(IMAGE_CONCURRENCY)
+            dims = {}
 
             async def _download(u: str):
                 name = u.rsplit('/', 1)[-1].split('?')[0]
@@ -223,13 +235,19 @@ class CFScraper:
                     return
                 async with sem:
                     body = await self._fetch_image(u, chapter_url)
-                    out_path.write_bytes(body)
+                    write_page(out_path, body)
+                    size = image_size(body)
+                    if size:
+                        dims[name] = size
                     # Small jitter per fetch keeps the burst rate below
                     # Cloudflare's adaptive rate-limit.
                     await asyncio.sleep(0.15)
 
             results = await asyncio.gather(*(_download(u) for u in urls),
                                            return_exceptions=True)
+            # Saved even when some pages failed, so the retry only has to
+            # measure the pages it actually fetches.
+            save_dimensions(save_dir, dims)
             errors = [r for r in results if isinstance(r, BaseException)]
             if errors:
                 raise errors[0]
@@ -16,24 +16,41 @@ picked up until either the file is deleted or a chapter for the affected
 series is re-uploaded.
 """
 
+import asyncio
 import json
 import logging
 import os
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
 COMPLETION_MARKER = "completed"
+# Second-resolution ISO 8601, local time. time.strftime is one C call, where
+# datetime.fromtimestamp().isoformat() builds an object per chapter.
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# A lone chapter update is written straight away; further updates inside
+# this window (a userscript batch) are coalesced into one trailing write.
+SAVE_DELAY_SECONDS = 2.0
 
 
 class SeriesIndex:
     def __init__(self, data_dir: str | Path, downloads_dir: str | Path):
         self.path = Path(data_dir) / "series_index.json"
         self.downloads_dir = Path(downloads_dir)
+        # Bumped on every mutation so readers can cache derived views and
+        # cheaply tell when they're stale.
+        self.version = 0
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._write_lock = threading.Lock()
+        # Snapshots are numbered so a slow write can't land over a newer one.
+        self._snapshot_seq = 0
+        self._written_seq = 0
         self._state: dict = self._load_or_build()
 
     # ----- public ---------------------------------------------------------
@@ -51,10 +68,21 @@ class SeriesIndex:
     def update_chapter(self, series_name: str, chapter_name: str, chapter_path: Path):
         meta = self._scan_chapter(chapter_path)
         self._state.setdefault(series_name, {})[chapter_name] = meta
-        self._save()
+        self.version += 1
+        self._schedule_save()
+
+    def flush(self):
+        """Write any pending update now (e.g. on shutdown)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._save()
 
     def rebuild(self) -> dict:
         self._state = self._scan_downloads()
+        self.version += 1
         self._save()
         return self._state
 
@@ -85,13 +113,13 @@ class SeriesIndex:
                         if not chapter_entry.is_dir():
                             continue
                         chapters[chapter_entry.name] = self._scan_chapter(
-                            Path(chapter_entry.path)
+                            chapter_entry.path, chapter_entry.stat(),
                         )
                 state[series_entry.name] = chapters
         return state
 
     @staticmethod
-    def _scan_chapter(chapter_path: Path) -> dict:
+    def _scan_chapter(chapter_path: str | Path, chapter_stat: Optional[os.stat_result] = None) -> dict:
         page_count = 0
         is_complete = False
         with os.scandir(chapter_path) as it:
@@ -106,29 +134,69 @@ class SeriesIndex:
                 dot = name.rfind('.')
                 if dot == -1:
                     continue
-                if name[dot:].lower() in IMAGE_EXTENSIONS:
+                # Exact match first; only fold case when that misses.
+                ext = name[dot:]
+                if ext in IMAGE_EXTENSIONS or ext.lower() in IMAGE_EXTENSIONS:
                     page_count += 1
         try:
-            last_modified = datetime.fromtimestamp(
-                chapter_path.stat().st_mtime
-            ).isoformat()
-        except Exception:
-            last_modified = datetime.now().isoformat()
+            # During a rebuild the caller passes the DirEntry's cached stat;
+            # single-chapter updates still stat the path themselves.
+            if chapter_stat is None:
+                chapter_stat = os.stat(chapter_path)
+            last_modified = time.strftime(TIMESTAMP_FORMAT, time.localtime(chapter_stat.st_mtime))
+        except OSError:
+            last_modified = time.strftime(TIMESTAMP_FORMAT)
         return {
             "is_complete": is_complete,
             "page_count": page_count,
             "last_modified": last_modified,
         }
 
+    def _schedule_save(self):
+        self._dirty = True
+        if self._save_handle is not None:
+            # Inside a burst: the trailing write will pick this up.
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, tests): nothing to defer onto.
+            self.flush()
+            return
+        # The index is trusted on load, so an update is never held back
+        # waiting for company; only what follows inside the window waits.
+        self._save_snapshot(loop)
+        self._save_handle = loop.call_later(SAVE_DELAY_SECONDS, self._save_pending)
+
+    def _save_pending(self):
+        self._save_handle = None
+        if self._dirty:
+            self._save_snapshot(asyncio.get_running_loop())
+
+    def _save_snapshot(self, loop: asyncio.AbstractEventLoop):
+        self._dirty = False
+        # Serialize on the loop thread so the snapshot can't race a
+        # concurrent update; only the file write goes to the threadpool.
+        payload = json.dumps(self._state)
+        self._snapshot_seq += 1
+        loop.run_in_executor(None, self._write, payload, self._snapshot_seq)
+
     def _save(self):
         self._save_state(self._state)
 
     def _save_state(self, state: dict):
+        self._snapshot_seq += 1
+        self._write(json.dumps(state), self._snapshot_seq)
+
+    def _write(self, payload: str, seq: int):
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            tmp = self.path.with_suffix(".json.tmp")
-            with open(tmp, "w") as f:
-                json.dump(state, f)
-            tmp.replace(self.path)
+            with self._write_lock:
+                if seq < self._written_seq:
+                    return
+                self._written_seq = seq
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".json.tmp")
+                tmp.write_text(payload)
+                tmp.replace(self.path)
         except Exception as e:
             logger.warning("⚠️ Could not save series_index: %s", e)
@@ -1,14 +1,25 @@
 // APIClient - Handles all fetch operations and API communication
 
+// Shared by every JSON POST rather than rebuilt per call
+const JSON_HEADERS = Object.freeze({ 'Content-Type': 'application/json' });
+
 const APIClient = {
     // Internal state
     apiBase: '',
+    // Fixed endpoint URLs, built once in init()
+    urls: {},
 
     /**
      * Initialize the API client
      */
     init: function() {
         this.apiBase = window.RipRaven.getApiBaseUrl();
+        this.urls = {
+            series: `${this.apiBase}/series`,
+            recent: `${this.apiBase}/recent`,
+            tracked: `${this.apiBase}/tracked`,
+            importManga: `${this.apiBase}/import-manga`
+        };
     },
 
     /**
@@ -16,7 +27,7 @@ const APIClient = {
      */
     loadSeries: async function() {
         try {
-            const response = await fetch(`${this.apiBase}/series`);
+            const response = await fetch(this.urls.series);
             if (!response.ok) {
                 throw new Error(`Failed to load series: ${response.status}`);
             }
@@ -32,7 +43,7 @@ const APIClient = {
      */
     loadRecent: async function() {
         try {
-            const response = await fetch(`${this.apiBase}/recent`);
+            const response = await fetch(this.urls.recent);
             if (!response.ok) {
                 throw new Error(`Failed to load recent chapters: ${response.status}`);
             }
@@ -59,17 +70,27 @@ const APIClient = {
         }
     },
 
+    /**
+     * Count locally available chapters after a given chapter
+     */
+    countChaptersAfter: async function(seriesName, chapterNum) {
+        const response = await fetch(`${this.apiBase}/chapter-count/${seriesName}/${chapterNum}`);
+        if (!response.ok) {
+            throw new Error(`Failed to count chapters: ${response.status}`);
+        }
+        const data = await response.json();
+        return data.count;
+    },
+
     /**
      * Save recent chapter to reading history
      */
     saveRecentChapter: async function(seriesName, chapterName) {
         try {
             const chapterNum = window.RipRaven.parseChapterNumber(chapterName);
-            const response = await fetch(`${this.apiBase}/recent`, {
+            const response = await fetch(this.urls.recent, {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
+                headers: JSON_HEADERS,
                 body: JSON.stringify({
                     series: seriesName,
                     chapter: chapterName,
@@ -90,15 +111,18 @@ const APIClient = {
     },
 
     /**
-     * Check download status for a series
+     * Check download status for a series. Resolves to its /tracked entry,
+     * or null when the series isn't tracked.
      */
     checkDownloadStatus: async function(seriesName) {
         try {
-            const response = await fetch(`${this.apiBase}/download-status/${seriesName}`);
+            // /tracked carries an ETag, so unchanged polls revalidate to a 304
+            const response = await fetch(this.urls.tracked);
             if (!response.ok) {
                 throw new Error(`Failed to check download status: ${response.status}`);
             }
-            return await response.json();
+            const tracked = await response.json();
+            return tracked.find(t => t.series_name === seriesName) || null;
         } catch (error) {
             console.error('Error checking download status:', error);
             throw error;
@@ -110,11 +134,9 @@ const APIClient = {
      */
     importManga: async function(mangaUrl) {
         try {
-            const response = await fetch(`${this.apiBase}/import-manga`, {
+            const response = await fetch(this.urls.importManga, {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
+                headers: JSON_HEADERS,
                 body: JSON.stringify({ url: mangaUrl })
             });
 
@@ -154,9 +176,7 @@ const APIClient = {
         try {
             const response = await fetch(`${this.apiBase}${endpoint}`, {
                 method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
+                headers: JSON_HEADERS,
                 body: JSON.stringify(data)
             });
 
@@ -18,12 +18,27 @@ function compareChapterNumbers(a, b) {
     return minorA - minorB;
 }
 
+/**
+ * Template for one comic page: a .comic-page div wrapping a lazy,
+ * async-decoded <img>. buildChapter clones it per page.
+ */
+const PAGE_PROTOTYPE = (() => {
+    const pageDiv = document.createElement('div');
+    pageDiv.className = 'comic-page';
+    const img = document.createElement('img');
+    img.loading = 'lazy'; // Lazy load images
+    img.decoding = 'async'; // Decode off the main thread
+    pageDiv.appendChild(img);
+    return pageDiv;
+})();
+
 const ChapterRenderer = {
     // Internal state
     comicContainer: null,
     chapterObserver: null,
     isInitialSetup: false,
-    chapterBoundaries: [],
+    pendingChapter: null,           // Last chapter seen entering the band this frame
+    chapterFramePending: false,
     isLoadingNextChapters: false,
     lastFrontierCheck: 0,           // Timestamp of last frontier API call
     frontierCooldownMs: 60000,      // 60s cooldown between frontier checks
@@ -46,43 +61,63 @@ const ChapterRenderer = {
                 return;
             }
 
+            // A fast fling can cross several chapters between frames; only
+            // the last one entering the band matters.
             entries.forEach(entry => {
                 // Keep as string to support fractional chapters (1.1, 1.2, etc.)
                 const chapterNum = entry.target.dataset.chapterNum;
-
                 if (entry.isIntersecting && chapterNum) {
-                    const chapterName = `chapter_${chapterNum}`;
-
-                    // Notify state manager about chapter change
-                    if (window.RipRaven.StateManager) {
-                        window.RipRaven.StateManager.setCurrentDisplayChapter(chapterNum);
-                        window.RipRaven.StateManager.setCurrentChapter(chapterName);
-                    }
-
-                    // Update URL and save progress
-                    if (window.RipRaven.NavigationManager && window.RipRaven.StateManager) {
-                        const currentSeries = window.RipRaven.StateManager.currentSeries;
-                        window.RipRaven.NavigationManager.updateURL(currentSeries, chapterNum, { method: 'replace' });
-                    }
-
-                    // Update chapter indicator
-                    if (window.RipRaven.UIController) {
-                        window.RipRaven.UIController.updateChapterIndicator(chapterNum);
-                    }
-
-                    // Save reading progress
-                    this.saveReadingProgress();
-
-                    // Check for new content if at frontier
-                    this.checkForNewContent(chapterNum);
+                    this.pendingChapter = chapterNum;
                 }
             });
+
+            if (this.pendingChapter !== null && !this.chapterFramePending) {
+                this.chapterFramePending = true;
+                requestAnimationFrame(() => {
+                    this.chapterFramePending = false;
+                    const chapterNum = this.pendingChapter;
+                    this.pendingChapter = null;
+                    if (chapterNum !== null) {
+                        this.onChapterVisible(chapterNum);
+                    }
+                });
+            }
         }, {
             rootMargin: '-20% 0px -70% 0px', // Trigger when chapter is 20% down from top
             threshold: 0
         });
     },
 
+    /**
+     * Commit a chapter change detected by the observer (at most once per frame)
+     */
+    onChapterVisible: function(chapterNum) {
+        const chapterName = `chapter_${chapterNum}`;
+
+        // Notify state manager about chapter change
+        if (window.RipRaven.StateManager) {
+            window.RipRaven.StateManager.setCurrentDisplayChapter(chapterNum);
+            window.RipRaven.StateManager.setCurrentChapter(chapterName);
+        }
+
+        // Update URL and save progress
+        if (window.RipRaven.NavigationManager && window.RipRaven.StateManager) {
+            const currentSeries = window.RipRaven.StateManager.currentSeries;
+            window.RipRaven.NavigationManager.updateURL(currentSeries, chapterNum, { method: 'replace' });
+        }
+
+        // Update chapter indicator
+        if (window.RipRaven.UIController) {
+            window.RipRaven.UIController.updateChapterIndicator(chapterNum);
+        }
+
+        // Save reading progress
+        this.saveReadingProgress();
+
+        // Check for new content if at frontier
+        this.checkForNewContent(chapterNum);
+    },
+
     /**
      * Render infinite chapters to the DOM
      */
@@ -91,46 +126,18 @@ const ChapterRenderer = {
         this.isInitialSetup = true;
 
         this.comicContainer.innerHTML = '';
-        this.chapterBoundaries = []; // Keep for backward compatibility
 
         let highestChapterInBatch = window.RipRaven.StateManager ? window.RipRaven.StateManager.maxLoadedChapter || null : null;
 
+        // Build everything off-document, then insert once: one style/layout
+        // pass for the whole batch instead of one per appended node.
+        const fragment = document.createDocumentFragment();
+        const containers = [];
+
         chaptersData.forEach((chapter, chapterIndex) => {
             // Add chapter divider (except for first chapter)
-            if (chapterIndex > 0) {
-                const divider = document.createElement('div');
-                divider.className = 'chapter-divider';
-                divider.innerHTML = `<div class="chapter-divider-text">Chapter ${chapter.chapter_num}</div>`;
-                this.comicContainer.appendChild(divider);
-            }
-
-            // Create chapter container for Intersection Observer
-            const chapterContainer = document.createElement('div');
-            chapterContainer.className = 'chapter-container';
-            chapterContainer.dataset.chapterNum = chapter.chapter_num;
-
-            // Add all images for this chapter
-            chapter.images.forEach((imageUrl, pageIndex) => {
-                const pageDiv = document.createElement('div');
-                pageDiv.className = 'comic-page';
-                pageDiv.dataset.chapterNum = chapter.chapter_num;
-                pageDiv.dataset.pageNum = pageIndex + 1;
-
-                const img = document.createElement('img');
-                // Prepend base path for mounted apps
-                const apiBase = window.RipRaven.APIClient ? window.RipRaven.APIClient.getApiBase() : '';
-                img.src = apiBase ? `${apiBase}/${imageUrl}` : `/${imageUrl}`;
-                img.alt = `Chapter ${chapter.chapter_num} Page ${pageIndex + 1}`;
-                img.loading = 'lazy'; // Lazy load images
-
-                pageDiv.appendChild(img);
-                chapterContainer.appendChild(pageDiv);
-            });
-
-            this.comicContainer.appendChild(chapterContainer);
-
-            // Observe this chapter for scroll tracking
-            this.chapterObserver.observe(chapterContainer);
+            // The first pages of the batch are what the reader lands on
+            containers.push(this.buildChapter(fragment, chapter, chapterIndex > 0, chapterIndex === 0 ? 2 : 0));
 
             // Update highest chapter using comparison function for fractional chapters
             if (highestChapterInBatch === null || compareChapterNumbers(chapter.chapter_num, highestChapterInBatch) > 0) {
@@ -138,6 +145,11 @@ const ChapterRenderer = {
             }
         });
 
+        this.comicContainer.appendChild(fragment);
+
+        // Observe each chapter for scroll tracking
+        containers.forEach(container => this.chapterObserver.observe(container));
+
         // Update state manager with new data
         if (window.RipRaven.StateManager) {
             window.RipRaven.StateManager.setMaxLoadedChapter(highestChapterInBatch);
@@ -158,9 +170,74 @@ const ChapterRenderer = {
         setTimeout(() => {
             this.isInitialSetup = false;
         }, 500); // Wait 500ms for DOM to settle
+    },
+
+    /**
+     * Append one chapter (optional divider + pages) to parent and return
+     * its container. The first `priorityPages` images load eagerly at high
+     * fetch priority; the rest stay lazy.
+     */
+    buildChapter: function(parent, chapter, withDivider, priorityPages = 0) {
+        if (withDivider) {
+            const divider = document.createElement('div');
+            divider.className = 'chapter-divider';
+            divider.innerHTML = `<div class="chapter-divider-text">Chapter ${chapter.chapter_num}</div>`;
+            parent.appendChild(divider);
+        }
+
+        // Create chapter container for Intersection Observer
+        const chapterContainer = document.createElement('div');
+        chapterContainer.className = 'chapter-container';
+        chapterContainer.dataset.chapterNum = chapter.chapter_num;
+
+        // Prepend base path for mounted apps
+        const apiBase = window.RipRaven.APIClient ? window.RipRaven.APIClient.getApiBase() : '';
+        const chapterNum = chapter.chapter_num;
+        const pageWidth = chapter.dimensions ? this.pageContentWidth() : 0;
+
+        // Add all images for this chapter
+        chapter.images.forEach((imageUrl, pageIndex) => {
+            // Cloning the prototype copies its class and image attributes in
+            // one native call instead of two createElement + setup per page.
+            const pageDiv = PAGE_PROTOTYPE.cloneNode(true);
+            const img = pageDiv.firstChild;
+
+            img.alt = `Chapter ${chapterNum} Page ${pageIndex + 1}`;
+            // Known pixel size → the browser reserves the page's box (via
+            // its aspect ratio) before the image arrives.
+            const dims = chapter.dimensions && chapter.dimensions[pageIndex];
+            if (dims) {
+                img.width = dims[0];
+                img.height = dims[1];
+                // content-visibility skips the img's own sizing until the
+                // page renders, so give the page its scaled height directly.
+                if (pageWidth > 0 && dims[0] > 0) {
+                    const height = Math.round(Math.min(dims[0], pageWidth) * dims[1] / dims[0]);
+                    pageDiv.style.containIntrinsicSize = `auto ${height}px`;
+                }
+            }
+            if (pageIndex < priorityPages) {
+                img.loading = 'eager';
+                img.fetchPriority = 'high';
+            }
+            // src last, once loading/priority are settled
+            img.src = apiBase ? `${apiBase}/${imageUrl}` : `/${imageUrl}`;
+
+            chapterContainer.appendChild(pageDiv);
+        });
+
+        parent.appendChild(chapterContainer);
+        return chapterContainer;
+    },
 
-        // Force layout calculation for accurate boundaries (keep for compatibility)
-        setTimeout(() => this.updateChapterBoundaries(), 1000);
+    /**
+     * Width available to a page image (the container's content box);
+     * read once per chapter so building its pages doesn't touch layout.
+     */
+    pageContentWidth: function() {
+        if (!this.comicContainer) return 0;
+        const style = getComputedStyle(this.comicContainer);
+        return this.comicContainer.clientWidth - parseFloat(style.paddingLeft) - parseFloat(style.paddingRight);
     },
 
     /**
@@ -171,42 +248,12 @@ const ChapterRenderer = {
             return;
         }
 
-        const currentScrollY = window.scrollY;
-
-        newChapters.forEach((chapter) => {
-            // Add chapter divider
-            const divider = document.createElement('div');
-            divider.className = 'chapter-divider';
-            divider.innerHTML = `<div class="chapter-divider-text">Chapter ${chapter.chapter_num}</div>`;
-            this.comicContainer.appendChild(divider);
-
-            // Create chapter container
-            const chapterContainer = document.createElement('div');
-            chapterContainer.className = 'chapter-container';
-            chapterContainer.dataset.chapterNum = chapter.chapter_num;
-
-            // Add all images for this chapter
-            chapter.images.forEach((imageUrl, pageIndex) => {
-                const pageDiv = document.createElement('div');
-                pageDiv.className = 'comic-page';
-                pageDiv.dataset.chapterNum = chapter.chapter_num;
-                pageDiv.dataset.pageNum = pageIndex + 1;
-
-                const img = document.createElement('img');
-                const apiBase = window.RipRaven.APIClient ? window.RipRaven.APIClient.getApiBase() : '';
-                img.src = apiBase ? `${apiBase}/${imageUrl}` : `/${imageUrl}`;
-                img.alt = `Chapter ${chapter.chapter_num} Page ${pageIndex + 1}`;
-                img.loading = 'lazy';
-
-                pageDiv.appendChild(img);
-                chapterContainer.appendChild(pageDiv);
-            });
+        const fragment = document.createDocumentFragment();
+        const containers = newChapters.map(chapter => this.buildChapter(fragment, chapter, true));
+        this.comicContainer.appendChild(fragment);
 
-            this.comicContainer.appendChild(chapterContainer);
-
-            // Observe this chapter for scroll tracking
-            this.chapterObserver.observe(chapterContainer);
-        });
+        // Observe each chapter for scroll tracking
+        containers.forEach(container => this.chapterObserver.observe(container));
 
         // Update state manager
         if (window.RipRaven.StateManager) {
@@ -220,53 +267,6 @@ const ChapterRenderer = {
             });
             window.RipRaven.StateManager.setMaxLoadedChapter(currentMax);
         }
-
-        // Maintain scroll position
-        window.scrollTo(0, currentScrollY);
-
-        // Refresh boundaries after DOM grows
-        setTimeout(() => this.updateChapterBoundaries(), 500);
-    },
-
-    /**
-     * Update chapter boundaries for backward compatibility
-     */
-    updateChapterBoundaries: function() {
-        // Recalculate chapter boundaries based on actual rendered positions
-        this.chapterBoundaries = [];
-        const pages = this.comicContainer.querySelectorAll('.comic-page');
-        let currentChapter = null;
-        let chapterStartY = 0;
-
-        pages.forEach((page, index) => {
-            // Keep as string for fractional chapter support
-            const chapterNum = page.dataset.chapterNum;
-
-            if (currentChapter !== chapterNum) {
-                // Finish previous chapter
-                if (currentChapter !== null) {
-                    this.chapterBoundaries.push({
-                        chapterNum: currentChapter,
-                        startY: chapterStartY,
-                        endY: page.offsetTop
-                    });
-                }
-
-                // Start new chapter
-                currentChapter = chapterNum;
-                chapterStartY = page.offsetTop;
-            }
-        });
-
-        // Add the last chapter
-        if (currentChapter !== null && pages.length > 0) {
-            const lastPage = pages[pages.length - 1];
-            this.chapterBoundaries.push({
-                chapterNum: currentChapter,
-                startY: chapterStartY,
-                endY: lastPage.offsetTop + lastPage.offsetHeight
-            });
-        }
     },
 
     /**
@@ -301,6 +301,15 @@ const ChapterRenderer = {
         this.isLoadingNextChapters = true;
 
         try {
+            // Cheap probe first: skip the full chapter load when nothing
+            // past what's already rendered exists on disk.
+            if (currentMax !== null) {
+                const newer = await window.RipRaven.APIClient.countChaptersAfter(currentSeries, currentMax);
+                if (newer === 0) {
+                    return;
+                }
+            }
+
             const newData = await window.RipRaven.APIClient.loadInfiniteChapters(currentSeries, chapterNum);
 
             // Use comparison function for fractional chapters
@@ -338,9 +347,11 @@ const ChapterRenderer = {
         try {
             await window.RipRaven.APIClient.saveRecentChapter(currentSeries, currentChapter);
 
-            // Reload recent chapters to update UI
-            if (window.comicReader && typeof window.comicReader.loadRecent === 'function') {
-                await window.comicReader.loadRecent();
+            // Update the recents UI locally instead of re-fetching a list
+            // that differs only by this entry
+            const recent = window.RipRaven.StateManager.addRecentChapter(currentSeries, currentChapter);
+            if (window.RipRaven.UIController) {
+                window.RipRaven.UIController.updateRecentSection(recent);
             }
         } catch (error) {
             console.error('Error saving reading progress:', error);
@@ -354,7 +365,6 @@ const ChapterRenderer = {
         if (this.comicContainer) {
             this.comicContainer.innerHTML = '';
         }
-        this.chapterBoundaries = [];
     },
 
     /**
@@ -1,5 +1,8 @@
 // StateManager - Manages application state and data
 
+// Matches the server's cap on the recent chapters list
+const RECENT_LIMIT = 10;
+
 const StateManager = {
     // Current state
     currentSeries: null,
@@ -88,6 +91,18 @@ const StateManager = {
         this.recentChapters = chapters;
     },
 
+    /**
+     * Apply a saved chapter to the local recents the same way the server
+     * does: one entry per series, newest first.
+     */
+    addRecentChapter: function(series, chapter) {
+        const entry = { series, chapter, last_read: new Date().toISOString(), page_position: 0 };
+        this.recentChapters = [entry]
+            .concat(this.recentChapters.filter(r => r.series !== series))
+            .slice(0, RECENT_LIMIT);
+        return this.recentChapters;
+    },
+
     getCurrentStartChapter: function() {
         return this.currentStartChapter;
     },
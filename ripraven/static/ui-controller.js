@@ -1,5 +1,8 @@
 // UIController - Manages UI elements, interactions, and visual state
 
+const DOWNLOAD_POLL_MIN_MS = 5000;
+const DOWNLOAD_POLL_MAX_MS = 60000;
+
 const UIController = {
     // DOM Elements
     seriesSelect: null,
@@ -17,6 +20,13 @@ const UIController = {
     headerToggle: null,
     headerContent: null,
 
+    // Download status polling
+    downloadPollTimer: null,
+    downloadPollDelay: DOWNLOAD_POLL_MIN_MS,
+    downloadPollGeneration: 0,      // Bumped on restart; stale loops see it and stop
+    downloadPollResume: null,       // Pending visibilitychange listener, if any
+    lastDownloadSig: null,
+
     /**
      * Initialize the UI controller
      */
@@ -61,6 +71,16 @@ const UIController = {
         if (this.headerToggle) {
             this.headerToggle.addEventListener('click', () => this.onHeaderToggle());
         }
+
+        // One delegated listener; items carry their target in data attributes
+        // and are rebuilt freely without re-binding handlers.
+        if (this.recentList) {
+            this.recentList.addEventListener('click', (event) => {
+                const item = event.target.closest('.recent-item');
+                if (!item) return;
+                this.loadRecentChapter(item.dataset.series, item.dataset.chapter);
+            });
+        }
     },
 
     /**
@@ -238,9 +258,8 @@ const UIController = {
                 const safeChapter = chapterNum || '1';
                 const seriesName = recent.series.length > 30 ? recent.series.slice(0, 30) + '...' : recent.series;
                 item.textContent = `${seriesName} · Chapter ${safeChapter}`;
-                item.addEventListener('click', () => {
-                    this.loadRecentChapter(recent.series, safeChapter);
-                });
+                item.dataset.series = recent.series;
+                item.dataset.chapter = safeChapter;
                 this.recentList.appendChild(item);
             });
         }
@@ -323,40 +342,84 @@ const UIController = {
     },
 
     // Download Status Management
-    checkDownloadStatus: async function() {
+    // One self-scheduling poll per reader: it backs off while progress stands
+    // still, snaps back when a chapter lands, and stops once caught up.
+    checkDownloadStatus: function() {
+        clearTimeout(this.downloadPollTimer);
+        this.downloadPollTimer = null;
+        if (this.downloadPollResume) {
+            document.removeEventListener('visibilitychange', this.downloadPollResume);
+            this.downloadPollResume = null;
+        }
+        this.downloadPollGeneration++;
+        this.downloadPollDelay = DOWNLOAD_POLL_MIN_MS;
+        this.lastDownloadSig = null;
+        this.pollDownloadStatus(this.downloadPollGeneration);
+    },
+
+    pollDownloadStatus: async function(generation) {
+        this.downloadPollTimer = null;
         const currentSeries = window.RipRaven.StateManager ? window.RipRaven.StateManager.currentSeries : null;
         if (!currentSeries || !window.RipRaven.APIClient) return;
 
+        if (document.hidden) {
+            this.downloadPollResume = () => {
+                this.downloadPollResume = null;
+                if (generation === this.downloadPollGeneration) {
+                    this.pollDownloadStatus(generation);
+                }
+            };
+            document.addEventListener('visibilitychange', this.downloadPollResume, { once: true });
+            return;
+        }
+
+        let entry;
         try {
-            const data = await window.RipRaven.APIClient.checkDownloadStatus(currentSeries);
+            entry = await window.RipRaven.APIClient.checkDownloadStatus(currentSeries);
+        } catch (error) {
+            entry = undefined;
+        }
+        // A navigation restarted the poll while this fetch was in flight
+        if (generation !== this.downloadPollGeneration) return;
 
-            const activeDownloads = data.statuses.filter(status =>
-                status.status === 'downloading' || status.status === 'pending'
-            );
+        if (entry === null || (entry && entry.has_chapter_list && entry.downloaded_chapters >= entry.total_chapters)) {
+            this.hideDownloadStatus();
+            return;
+        }
 
-            if (activeDownloads.length > 0) {
-                this.showDownloadStatus(activeDownloads);
+        if (entry) {
+            const sig = `${entry.downloaded_chapters}/${entry.total_chapters}`;
+            if (sig !== this.lastDownloadSig) {
+                this.lastDownloadSig = sig;
+                this.downloadPollDelay = DOWNLOAD_POLL_MIN_MS;
+                this.showDownloadStatus(entry);
             } else {
-                this.hideDownloadStatus();
+                this.downloadPollDelay = Math.min(this.downloadPollDelay * 2, DOWNLOAD_POLL_MAX_MS);
             }
-        } catch (error) {
-            console.error('Error checking download status:', error);
+        } else {
+            // Transient failure: keep polling, but back off
+            this.downloadPollDelay = Math.min(this.downloadPollDelay * 2, DOWNLOAD_POLL_MAX_MS);
         }
+
+        this.downloadPollTimer = setTimeout(() => this.pollDownloadStatus(generation), this.downloadPollDelay);
     },
 
-    showDownloadStatus: function(downloads) {
+    showDownloadStatus: function(entry) {
         if (this.downloadText) {
-            this.downloadText.textContent = `Downloading ${downloads.length} chapters...`;
+            this.downloadText.textContent = entry.has_chapter_list
+                ? `Downloading ${entry.total_chapters - entry.downloaded_chapters} chapters...`
+                : 'Fetching chapter list...';
         }
         if (this.progressFill) {
-            this.progressFill.style.width = '50%'; // Placeholder progress
+            const pct = entry.total_chapters > 0
+                ? Math.round(100 * entry.downloaded_chapters / entry.total_chapters)
+                : 0;
+            this.progressFill.style.width = `${pct}%`;
         }
         if (this.downloadStatus) {
             this.downloadStatus.classList.remove('hidden');
         }
-
-        // Hide after a few seconds
-        setTimeout(() => this.hideDownloadStatus(), 5000);
+        // Stays up until a poll finds the series caught up
     },
 
     hideDownloadStatus: function() {
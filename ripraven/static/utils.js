@@ -70,31 +70,56 @@ const UrlUtils = {
  * Keyboard shortcuts handler
  */
 function setupKeyboardShortcuts() {
-    document.addEventListener('keydown', (e) => {
-        switch(e.key) {
-            case 'ArrowUp':
-            case 'k':
-                window.scrollBy(0, -100);
-                e.preventDefault();
-                break;
-            case 'ArrowDown':
-            case 'j':
-                window.scrollBy(0, 100);
-                e.preventDefault();
-                break;
-            case ' ':
-                window.scrollBy(0, window.innerHeight * 0.8);
-                e.preventDefault();
-                break;
-            case 'Home':
-                window.scrollTo(0, 0);
-                e.preventDefault();
-                break;
-            case 'End':
-                window.scrollTo(0, document.body.scrollHeight);
-                e.preventDefault();
-                break;
+    // Held keys repeat faster than the display refreshes; relative scrolls
+    // are summed and applied once per frame instead of once per keydown.
+    let scrollDelta = 0;
+    let scrollFramePending = false;
+
+    // Space pages by the viewport height; read it on resize (at most once
+    // per frame) rather than inside every keydown.
+    let viewportHeight = window.innerHeight;
+    let resizeFramePending = false;
+    window.addEventListener('resize', () => {
+        if (resizeFramePending) return;
+        resizeFramePending = true;
+        requestAnimationFrame(() => {
+            resizeFramePending = false;
+            viewportHeight = window.innerHeight;
+        });
+    }, { passive: true });
+
+    const flushScroll = () => {
+        scrollFramePending = false;
+        window.scrollBy({ top: scrollDelta, behavior: 'instant' });
+        scrollDelta = 0;
+    };
+
+    const queueScroll = (delta) => {
+        scrollDelta += delta;
+        if (!scrollFramePending) {
+            scrollFramePending = true;
+            requestAnimationFrame(flushScroll);
         }
+    };
+
+    const scrollToEdge = (top) => {
+        scrollDelta = 0;
+        window.scrollTo(0, top);
+    };
+
+    // Keys with no entry return before touching the event
+    const handlers = Object.create(null);
+    handlers.ArrowUp = handlers.k = () => queueScroll(-100);
+    handlers.ArrowDown = handlers.j = () => queueScroll(100);
+    handlers[' '] = () => queueScroll(viewportHeight * 0.8);
+    handlers.Home = () => scrollToEdge(0);
+    handlers.End = () => scrollToEdge(document.body.scrollHeight);
+
+    document.addEventListener('keydown', (e) => {
+        const handler = handlers[e.key];
+        if (!handler) return;
+        handler();
+        e.preventDefault();
     });
 }
 
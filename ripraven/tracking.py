@@ -13,7 +13,7 @@ import secrets
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,9 @@ class TrackingState:
         self.path = Path(data_dir) / "tracking.json"
         self._state: dict = self._load()
         self._claims: dict[str, dict] = {}
+        # item_id → token, so "is this item claimed?" is a dict hit instead
+        # of a scan over every live claim.
+        self._claims_by_item: dict[str, str] = {}
 
     def _load(self) -> dict:
         if self.path.exists():
@@ -77,25 +80,37 @@ class TrackingState:
     def _gc_claims(self):
         now = time.time()
         self._claims = {t: c for t, c in self._claims.items() if c['expires'] > now}
-
-    def _is_claimed(self, item_id: str) -> bool:
-        self._gc_claims()
-        return any(c['item_id'] == item_id for c in self._claims.values())
+        self._claims_by_item = {c['item_id']: t for t, c in self._claims.items()}
+
+    def _is_claimed(self, item_id: str, now: float) -> bool:
+        token = self._claims_by_item.get(item_id)
+        if token is None:
+            return False
+        claim = self._claims.get(token)
+        if claim is not None and claim['expires'] > now:
+            return True
+        # Expired lease: drop it here rather than waiting for the next GC.
+        del self._claims_by_item[item_id]
+        self._claims.pop(token, None)
+        return False
 
     def _claim(self, item_id: str) -> str:
         token = secrets.token_urlsafe(16)
         self._claims[token] = {'item_id': item_id, 'expires': time.time() + CLAIM_TTL_SECONDS}
+        self._claims_by_item[item_id] = token
         return token
 
     def release(self, token: str):
-        self._claims.pop(token, None)
+        claim = self._claims.pop(token, None)
+        if claim is not None and self._claims_by_item.get(claim['item_id']) == token:
+            del self._claims_by_item[claim['item_id']]
 
     # ---- queue building ----------------------------------------------------
 
     def build_queue(
         self,
         chapter_cache,
-        chapter_is_complete: Callable[[str, str], bool],
+        completed_chapters: Callable[[str], Set[str]],
         limit: int = 1,
     ) -> List[dict]:
         """Return up to `limit` actionable work items across all tracked series.
@@ -109,6 +124,12 @@ class TrackingState:
         claim_token; failures must POST /queue/release with it.
         """
         items: List[dict] = []
+        self._gc_claims()
+        now = time.time()
+        # Bound once; the chapter loop below can walk a long backlog.
+        append = items.append
+        is_claimed = self._is_claimed
+        get_chapters = chapter_cache.get_chapters
 
         for slug, info in self._state.items():
             if len(items) >= limit:
@@ -116,12 +137,12 @@ class TrackingState:
 
             series_name = info['series_name']
 
-            chapters = chapter_cache.get_chapters(series_name)
+            chapters = get_chapters(series_name)
             if not chapters:
                 item_id = f"{slug}/__list__"
-                if self._is_claimed(item_id):
+                if is_claimed(item_id, now):
                     continue
-                items.append({
+                append({
                     'type': 'chapter-list',
                     'series_slug': slug,
                     'series_name': series_name,
@@ -130,17 +151,19 @@ class TrackingState:
                 })
                 continue
 
+            # One bulk lookup per series instead of a probe per chapter.
+            completed = completed_chapters(series_name)
             # Oldest first — backfill in reading order from chapter 1 up.
             for ch in chapters:
                 if len(items) >= limit:
                     break
                 ch_num = str(ch['number'])
-                if chapter_is_complete(series_name, ch_num):
+                if ch_num in completed:
                     continue
                 item_id = f"{slug}/{ch_num}"
-                if self._is_claimed(item_id):
+                if is_claimed(item_id, now):
                     continue
-                items.append({
+                append({
                     'type': 'chapter',
                     'series_slug': slug,
                     'series_name': series_name,
@@ -159,12 +182,13 @@ class TrackingState:
         """Per-series progress snapshot for the home page UI."""
         out = []
         for slug, info in self._state.items():
-            chapters = chapter_cache.get_chapters(info['series_name']) or []
+            series_name = info['series_name']
+            chapters = chapter_cache.get_chapters(series_name) or []
             total = len(chapters)
-            done = sum(1 for ch in chapters if chapter_is_complete(info['series_name'], str(ch['number'])))
+            done = sum(1 for ch in chapters if chapter_is_complete(series_name, str(ch['number'])))
             out.append({
                 'series_slug': slug,
-                'series_name': info['series_name'],
+                'series_name': series_name,
                 'series_url': info['series_url'],
                 'total_chapters': total,
                 'downloaded_chapters': done,
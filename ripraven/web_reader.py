@@ -14,18 +14,28 @@ at GET /api/ripraven/static/ripraven.user.js. The server's job is reduced to:
 """
 
 import asyncio
-import json
+import bisect
+import functools
+import gzip
+import hashlib
 import logging
+import os
 import re
+import stat
+import threading
+import time
 from datetime import datetime
 from importlib import resources
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse
+import orjson
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from .pages import image_size, read_dimensions, save_dimensions, write_page
 from .pattern_finder import ChapterListCache, parse_chapter_url
 from .series_index import SeriesIndex
 from .tracking import TrackingState
@@ -33,11 +43,17 @@ from .tracking import TrackingState
 logger = logging.getLogger(__name__)
 
 
-def natural_sort_key(text: str) -> list:
-    """1, 2, 10 sort like that, not 1, 10, 2. Also handles 'chapter_1.1'."""
-    def convert(part):
-        return int(part) if part.isdigit() else part.lower()
-    return [convert(c) for c in re.split(r'(\d+)', text)]
+_NUM_SPLIT = re.compile(r'(\d+)').split
+
+
+@functools.lru_cache(maxsize=8192)
+def natural_sort_key(text: str) -> tuple:
+    """1, 2, 10 sort like that, not 1, 10, 2. Also handles 'chapter_1.1'.
+
+    Cached, since the same chapter/page names get re-keyed on every
+    request; a tuple, so the shared cached key can't be mutated.
+    """
+    return tuple(int(c) if c.isdigit() else c.lower() for c in _NUM_SPLIT(text))
 
 
 class ChapterInfo(BaseModel):
@@ -59,22 +75,6 @@ class RecentChapter(BaseModel):
     page_position: int = 0
 
 
-class InfiniteChapterData(BaseModel):
-    chapter_num: str
-    chapter_name: str
-    images: List[str]
-    page_count: int
-    is_complete: bool
-
-
-class InfiniteChaptersResponse(BaseModel):
-    series: str
-    current_chapter: str
-    chapters: List[InfiniteChapterData]
-    total_pages: int
-    download_status: Dict[str, str]
-
-
 class TrackRequest(BaseModel):
     url: str
 
@@ -101,15 +101,77 @@ class QueueRelease(BaseModel):
     claim_token: str
 
 
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+# Same set as a tuple for str.endswith, which checks all suffixes in one C call.
+IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)
 COMPLETION_MARKER = "completed"
+IMAGE_LIST_CACHE_SIZE = 1024
+# A new chapter dir bumps the series dir mtime, but pages landing in an
+# existing one don't; the TTL bounds how long that can go unnoticed.
+CHAPTER_LIST_TTL_SECONDS = 10.0
+# The reader probes ahead for chapters that aren't on disk yet; remember a
+# miss briefly so repeat probes don't hit the filesystem again.
+MISSING_CHAPTER_TTL_SECONDS = 10.0
+# Miss keys come straight from request URLs, so the table is capped.
+MISSING_CHAPTER_CACHE_SIZE = 1024
+# Page turns POST /recent in quick bursts; coalesce them into one write.
+RECENT_FLUSH_DELAY_SECONDS = 1.0
+# Pages of a completed chapter are never rewritten (the worker and the queue
+# skip completed chapters), so browsers may keep them for good. Pages of a
+# chapter still being written revalidate against their ETag instead.
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Page shells and the /series and /recent lists: browsers may keep them but
+# must revalidate every time, which costs a bodiless 304 while the ETag holds.
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class _NoCacheStaticFiles(StaticFiles):
+    """StaticFiles that makes browsers revalidate every time.
+
+    The reader JS/CSS and the userscript change on every deploy, so clients
+    must always check; StaticFiles' ETag/Last-Modified turn that check into
+    a 304 when nothing changed.
+    """
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "no-cache, must-revalidate"
+        return response
+
+
+@functools.cache
+def _load_templates() -> tuple[bytes, bytes]:
+    # Templates ship with the package and never change at runtime, so every
+    # RipRavenAPI instance shares one read. Kept as raw UTF-8 bytes: they're
+    # served verbatim, so there's no reason to decode and re-encode.
+    try:
+        base = resources.files(__package__).joinpath("templates")
+        reader_html = base.joinpath("ripraven_reader.html").read_bytes()
+        home_html = base.joinpath("ripraven_home.html").read_bytes()
+        return reader_html, home_html
+    except FileNotFoundError as exc:
+        logger.error("RipRaven template missing: %s", exc)
+        raise RuntimeError("RipRaven template missing") from exc
+    except OSError as exc:
+        logger.error("Failed to read RipRaven template: %s", exc)
+        raise RuntimeError("Unable to load RipRaven template") from exc
 
 
 class RipRavenAPI:
     def __init__(self, downloads_dir: str | Path = "../data/ripraven/downloads"):
         self.downloads_dir = Path(downloads_dir)
+        # Absolute string form for the image hot path, where os.path.join on
+        # str beats building a Path per request.
+        self._downloads_str = os.path.abspath(self.downloads_dir)
+        self._static_files = _NoCacheStaticFiles(directory=os.path.join(os.path.dirname(__file__), "static"))
         data_dir = self.downloads_dir.parent
         self.recent_file = data_dir / "recent_chapters.json"
+        # Loaded once; the in-memory list is authoritative and disk catches
+        # up on the debounced flush.
+        self._recent: List[RecentChapter] = self._load_recent_from_disk()
+        self._recent_dirty = False
+        self._recent_lock = threading.Lock()
+        self._recent_flush_task: Optional[asyncio.Task] = None
 
         self.chapter_cache = ChapterListCache(data_dir)
         self.tracking = TrackingState(data_dir)
@@ -117,8 +179,31 @@ class RipRavenAPI:
         # walks the (SSHFS-backed) downloads tree on the hot path. Writers
         # update entries in place; readers serve from RAM.
         self.series_index = SeriesIndex(data_dir, self.downloads_dir)
-
-        self.reader_template, self.home_template = self._load_templates()
+        # (index version, models) — /series is polled far more often than
+        # chapters land, so the sorted model list is reused until it changes.
+        self._series_cache: Optional[tuple[int, List[SeriesInfo]]] = None
+        # (version, encoded JSON) for /series and /recent. The versions also
+        # key their ETags; the epoch keeps a restarted process, whose
+        # counters start over, from matching an ETag issued by the last one.
+        self._series_body: Optional[tuple[int, bytes, bytes]] = None
+        self._recent_version = 0
+        self._recent_body: Optional[tuple[int, bytes]] = None
+        self._etag_epoch = f"{time.time_ns():x}"
+        # (series, chapter, dir mtime_ns) → (image URLs, per-page dimensions).
+        # Adding or removing a page, or rewriting the dimensions sidecar,
+        # bumps the dir mtime, so a stale key is simply never hit again.
+        self._image_list_cache: Dict[tuple[str, str, int], tuple[List[str], List[Optional[List[int]]]]] = {}
+        # series → (fetched at, series dir mtime_ns, readable chapter names)
+        self._chapter_list_cache: Dict[str, tuple[float, int, List[str]]] = {}
+        # (series, chapter dir name) → monotonic time the miss was seen
+        self._missing_chapters: Dict[tuple[str, str], float] = {}
+
+        self.reader_template, self.home_template = _load_templates()
+        self._reader_etag = _body_etag(self.reader_template)
+        self._home_etag = _body_etag(self.home_template)
+        # Compressed once here instead of per response by a middleware.
+        self._reader_gzip = gzip.compress(self.reader_template, 9)
+        self._home_gzip = gzip.compress(self.home_template, 9)
         self.router = APIRouter()
         self.setup_routes()
 
@@ -137,8 +222,9 @@ class RipRavenAPI:
             self.tracking,
             self.chapter_cache,
             self.downloads_dir,
-            self._chapter_is_complete,
+            self._completed_chapters,
             self.series_index,
+            self._chapter_written,
         ))
 
     async def stop_worker(self):
@@ -153,40 +239,71 @@ class RipRavenAPI:
             await self._scraper.close()
             self._scraper = None
 
-    def _load_templates(self) -> tuple[str, str]:
-        try:
-            base = resources.files(__package__).joinpath("templates")
-            reader_html = base.joinpath("ripraven_reader.html").read_text(encoding="utf-8")
-            home_html = base.joinpath("ripraven_home.html").read_text(encoding="utf-8")
-            return reader_html, home_html
-        except FileNotFoundError as exc:
-            logger.error("RipRaven template missing: %s", exc)
-            raise RuntimeError("RipRaven template missing") from exc
-        except OSError as exc:
-            logger.error("Failed to read RipRaven template: %s", exc)
-            raise RuntimeError("Unable to load RipRaven template") from exc
+    async def _run_fs(self, func, *args):
+        """Run blocking filesystem work on the threadpool.
+
+        The default executor (sized by IO_THREADS in backend/app.py) is the
+        only concurrency bound; calls beyond it queue there.
+        """
+        return await asyncio.to_thread(func, *args)
 
     # ----- chapter status -------------------------------------------------
 
+    def _chapter_written(self, series_name: str, chapter_name: str):
+        """Drop reader caches that a newly written chapter makes stale.
+
+        Called by both writers: the /pages upload handler and the worker.
+        """
+        self._chapter_list_cache.pop(series_name, None)
+        self._missing_chapters.pop((series_name, chapter_name), None)
+
     def _chapter_dir(self, series_name: str, chapter_num: str) -> Path:
         return self.downloads_dir / series_name / f"chapter_{chapter_num}"
 
-    def _chapter_is_complete(self, series_name: str, chapter_num: str) -> bool:
-        return (self._chapter_dir(series_name, chapter_num) / COMPLETION_MARKER).exists()
+    def _completed_chapters(self, series_name: str) -> set[str]:
+        """Numbers of every chapter of `series_name` that is fully on disk.
+
+        One scandir of the series dir settles every chapter with no dir at
+        all; chapters the index already marks complete are trusted, and only
+        the rest fall back to probing for the completion marker.
+        """
+        series_path = os.path.join(self._downloads_str, series_name)
+        try:
+            with os.scandir(series_path) as it:
+                chapter_dirs = [e.name for e in it if e.name.startswith('chapter_') and e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+        indexed = self.series_index.list_all().get(series_name, {})
+        done = set()
+        for name in chapter_dirs:
+            meta = indexed.get(name)
+            if (meta and meta.get("is_complete")) or os.path.exists(
+                os.path.join(series_path, name, COMPLETION_MARKER)
+            ):
+                done.add(name[len('chapter_'):])
+        return done
 
     def _chapter_status(self, series_name: str, chapter_num: str) -> dict:
-        d = self._chapter_dir(series_name, chapter_num)
-        if not d.exists():
+        # Single scandir: the completion marker is spotted by name while
+        # counting pages, instead of a separate exists() stat per probe.
+        page_count = 0
+        complete = False
+        try:
+            with os.scandir(self._chapter_dir(series_name, chapter_num)) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == COMPLETION_MARKER:
+                        complete = True
+                        continue
+                    dot = name.rfind('.')
+                    if dot == -1:
+                        continue
+                    ext = name[dot:]
+                    if (ext in IMAGE_EXTENSIONS or ext.lower() in IMAGE_EXTENSIONS) and entry.is_file():
+                        page_count += 1
+        except (FileNotFoundError, NotADirectoryError):
             return {"exists": False, "complete": False, "page_count": 0}
-        page_count = sum(
-            1 for p in d.iterdir()
-            if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
-        )
-        return {
-            "exists": True,
-            "complete": (d / COMPLETION_MARKER).exists(),
-            "page_count": page_count,
-        }
+        return {"exists": True, "complete": complete, "page_count": page_count}
 
     # ----- routes ---------------------------------------------------------
 
@@ -195,48 +312,41 @@ class RipRavenAPI:
         async def read_root():
             return {"service": "ripraven", "status": "ok"}
 
+        # A real Mount wouldn't survive include_router (only routes are
+        # copied), so this route hands the request to StaticFiles directly:
+        # containment, stat, content type and 304 handling all come from it.
         @self.router.get("/static/{file_path:path}")
-        async def serve_static_files(file_path: str):
-            static_dir = Path(__file__).parent / "static"
-            file_full_path = static_dir / file_path
-            try:
-                file_full_path.resolve().relative_to(static_dir.resolve())
-            except ValueError:
-                raise HTTPException(status_code=403, detail="Access denied")
-            if not file_full_path.exists():
-                raise HTTPException(status_code=404, detail="File not found")
-            content_type = "text/plain"
-            if file_path.endswith('.css'):
-                content_type = "text/css"
-            elif file_path.endswith('.user.js') or file_path.endswith('.js'):
-                content_type = "application/javascript"
-            response = FileResponse(file_full_path, media_type=content_type)
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            return response
+        async def serve_static_files(file_path: str, request: Request):
+            return await self._static_files.get_response(file_path, request.scope)
 
         @self.router.get("/series", response_model=List[SeriesInfo])
-        async def get_series():
+        async def get_series(request: Request):
             try:
-                return self.scan_series()
+                return self.get_series_response(request)
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.router.get("/recent", response_model=List[RecentChapter])
-        async def get_recent_chapters():
-            return self.load_recent_chapters()
+        async def get_recent_chapters(request: Request):
+            return self.get_recent_response(request)
 
         @self.router.post("/recent")
         async def update_recent_chapter(recent: RecentChapter):
             try:
                 self.save_recent_chapter(recent)
+                self._schedule_recent_flush()
                 return {"status": "success"}
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.router.get("/images/{series_name}/{chapter_name}")
         async def get_chapter_images_list(series_name: str, chapter_name: str):
+            # A recent miss is a dict lookup; answer it here rather than
+            # paying a threadpool round-trip just to raise.
+            if self._known_missing(series_name, chapter_name):
+                raise HTTPException(status_code=404, detail="Chapter not found")
             try:
-                images = self.get_chapter_images(series_name, chapter_name)
+                images = await self._run_fs(self.get_chapter_images, series_name, chapter_name)
                 return {"images": images, "total": len(images)}
             except FileNotFoundError:
                 raise HTTPException(status_code=404, detail="Chapter not found")
@@ -267,6 +377,7 @@ class RipRavenAPI:
                 last_read=datetime.now().isoformat(),
                 page_position=0,
             ))
+            self._schedule_recent_flush()
             return TrackResponse(
                 series_slug=parsed['series_slug'],
                 series_name=parsed['series_name'],
@@ -279,8 +390,14 @@ class RipRavenAPI:
             )
 
         @self.router.get("/tracked")
-        async def get_tracked():
-            return self.tracking.status(self.chapter_cache, self._chapter_is_complete)
+        async def get_tracked(request: Request):
+            # Progress display only, so the in-memory index is good enough —
+            # probing a marker file per chapter on every 30s poll was O(all
+            # chapters) round-trips to the SSHFS mount. Both the home page and
+            # the reader poll this, and most polls see no change: an ETag
+            # turns those into an empty 304.
+            body = orjson.dumps(self.tracking.status(self.chapter_cache, self.series_index.is_complete))
+            return _cached_response(body, _body_etag(body), request, "application/json")
 
         @self.router.delete("/tracked/{series_slug}")
         async def stop_tracking(series_slug: str):
@@ -291,7 +408,7 @@ class RipRavenAPI:
         async def get_queue(limit: int = 1):
             items = self.tracking.build_queue(
                 self.chapter_cache,
-                self._chapter_is_complete,
+                self._completed_chapters,
                 limit=max(1, min(limit, 5)),
             )
             return {"items": items}
@@ -334,27 +451,32 @@ class RipRavenAPI:
                 raise HTTPException(status_code=400, detail="No pages uploaded")
 
             series_name = tracked['series_name']
-            chapter_dir = self._chapter_dir(series_name, chapter_num)
+            chapter_name = f"chapter_{chapter_num}"
+            chapter_dir = self.downloads_dir / series_name / chapter_name
             chapter_dir.mkdir(parents=True, exist_ok=True)
 
             saved = 0
+            dims = {}
             for idx, up in enumerate(pages):
                 # Trust the userscript's naming if it gave us "<n>.<ext>"; otherwise
                 # synthesize a zero-padded order from the upload index.
                 name = (up.filename or "").strip().lstrip("/").split("/")[-1]
-                if not name or not any(name.lower().endswith(ext) for ext in IMAGE_EXTENSIONS):
+                if not name or not name.lower().endswith(IMAGE_SUFFIXES):
                     name = f"{idx:03d}.jpg"
                 out_path = chapter_dir / name
                 data = await up.read()
                 if not data:
                     continue
-                out_path.write_bytes(data)
+                write_page(out_path, data)
                 saved += 1
+                size = image_size(data)
+                if size:
+                    dims[name] = size
 
+            save_dimensions(chapter_dir, dims)
             (chapter_dir / COMPLETION_MARKER).write_text(datetime.now().isoformat())
-            self.series_index.update_chapter(
-                series_name, f"chapter_{chapter_num}", chapter_dir,
-            )
+            self.series_index.update_chapter(series_name, chapter_name, chapter_dir)
+            self._chapter_written(series_name, chapter_name)
             if claim_token:
                 self.tracking.release(claim_token)
 
@@ -366,173 +488,404 @@ class RipRavenAPI:
 
         # ---- reader ------------------------------------------------------
 
-        @self.router.get(
-            "/infinite-chapters/{series_name}/{current_chapter}",
-            response_model=InfiniteChaptersResponse,
-        )
+        # Plain dicts encoded by orjson: the image lists are hundreds of
+        # strings per chapter, and pydantic validation/re-encoding of them
+        # was most of this endpoint's CPU time.
+        @self.router.get("/infinite-chapters/{series_name}/{current_chapter}")
         async def get_infinite_chapters(series_name: str, current_chapter: str):
-            chapters_data: list[InfiniteChapterData] = []
+            chapters_to_load = await self._run_fs(
+                self.get_next_local_chapters, series_name, current_chapter, 2,
+            )
+            # Each chapter is an independent directory read; overlap them so
+            # the response waits for the slowest one, not the sum.
+            results = await asyncio.gather(*(
+                self._run_fs(self.load_reader_chapter, series_name, chapter_name)
+                for chapter_name in chapters_to_load
+            ))
+
+            chapters_data: list[dict] = []
             total_pages = 0
             download_status: dict[str, str] = {}
-
-            chapters_to_load = self.get_next_local_chapters(series_name, current_chapter, count=2)
-            for chapter_name in chapters_to_load:
-                chapter_num = self.extract_chapter_num_from_name(chapter_name)
-                status = self._chapter_status(series_name, chapter_num)
-                if not status["exists"]:
-                    download_status[chapter_name] = "not_available"
-                    continue
-                try:
-                    images = self.get_chapter_images(series_name, chapter_name)
-                except Exception:
-                    logger.exception("❌ Error loading chapter %s", chapter_num)
-                    download_status[chapter_name] = "error"
-                    continue
-                chapters_data.append(InfiniteChapterData(
-                    chapter_num=chapter_num,
-                    chapter_name=chapter_name,
-                    images=images,
-                    page_count=len(images),
-                    is_complete=status["complete"],
-                ))
-                total_pages += len(images)
-                download_status[chapter_name] = "complete" if status["complete"] else "incomplete"
-
-            return InfiniteChaptersResponse(
-                series=series_name,
-                current_chapter=current_chapter,
-                chapters=chapters_data,
-                total_pages=total_pages,
-                download_status=download_status,
-            )
+            for chapter_name, (status, chapter) in zip(chapters_to_load, results):
+                download_status[chapter_name] = status
+                if chapter is not None:
+                    chapters_data.append(chapter)
+                    total_pages += chapter["page_count"]
+
+            return Response(orjson.dumps({
+                "series": series_name,
+                "current_chapter": current_chapter,
+                "chapters": chapters_data,
+                "total_pages": total_pages,
+                "download_status": download_status,
+            }), media_type="application/json")
+
+        # The reader's "anything newer?" probe: a count from the cached
+        # chapter list, so the frontier check only pays for a full
+        # /infinite-chapters load when there is something to append.
+        @self.router.get("/chapter-count/{series_name}/{after_chapter}")
+        async def get_chapter_count(series_name: str, after_chapter: str):
+            count = await self._run_fs(self.count_local_chapters_after, series_name, after_chapter)
+            return {"count": count}
 
         @self.router.get("/image/{series_name}/{chapter_name}/{image_name}")
-        async def serve_image(series_name: str, chapter_name: str, image_name: str):
-            image_path = self.downloads_dir / series_name / chapter_name / image_name
-            if not image_path.exists():
+        async def serve_image(series_name: str, chapter_name: str, image_name: str, request: Request):
+            root = self._downloads_str
+            image_path = os.path.normpath(os.path.join(root, series_name, chapter_name, image_name))
+            if os.path.commonpath((root, image_path)) != root:
+                raise HTTPException(status_code=403, detail="Access denied")
+            try:
+                st = await self._run_fs(os.stat, image_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise HTTPException(status_code=404, detail="Image not found")
+            if not stat.S_ISREG(st.st_mode):
                 raise HTTPException(status_code=404, detail="Image not found")
-            return FileResponse(image_path)
+            etag = f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+            meta = self.series_index.chapter_meta(series_name, chapter_name)
+            cache_control = (
+                IMAGE_CACHE_CONTROL if meta and meta.get("is_complete") else REVALIDATE_CACHE_CONTROL
+            )
+            headers = {"ETag": etag, "Cache-Control": cache_control}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            # Hand over the stat we already have so FileResponse doesn't
+            # schedule a second one on the threadpool.
+            return FileResponse(image_path, headers=headers, stat_result=st)
 
         # Catch-all reader route — must be last.
         @self.router.get("/{series_name}/{chapter_num}", response_class=HTMLResponse)
-        async def read_chapter(series_name: str, chapter_num: int):
-            return self.get_reader_html()
+        async def read_chapter(series_name: str, chapter_num: int, request: Request):
+            return self.get_reader_response(request)
 
     # ----- local filesystem helpers ---------------------------------------
+    #
+    # Everything below does blocking disk I/O (the downloads tree sits on
+    # SSHFS); route handlers call it through _run_fs so a slow
+    # scan doesn't stall every other request on the event loop.
+
+    def load_reader_chapter(
+        self, series_name: str, chapter_name: str,
+    ) -> tuple[str, Optional[dict]]:
+        """Status string plus page data for one chapter of the reader feed."""
+        if self._known_missing(series_name, chapter_name):
+            return "not_available", None
+        chapter_num = self.extract_chapter_num_from_name(chapter_name)
+        status = self._chapter_status(series_name, chapter_num)
+        if not status["exists"]:
+            self._remember_missing(series_name, chapter_name)
+            return "not_available", None
+        try:
+            images, dimensions = self._chapter_pages(series_name, chapter_name)
+        except Exception:
+            logger.exception("❌ Error loading chapter %s", chapter_num)
+            return "error", None
+        chapter = {
+            "chapter_num": chapter_num,
+            "chapter_name": chapter_name,
+            "images": images,
+            # Lets the reader reserve each page's box before it loads, so
+            # later pages don't shift as earlier ones arrive.
+            "dimensions": dimensions,
+            "page_count": len(images),
+            "is_complete": status["complete"],
+        }
+        return ("complete" if status["complete"] else "incomplete"), chapter
 
     def scan_series(self) -> List[SeriesInfo]:
         # Reads from the in-memory mirror populated by SeriesIndex; no
         # filesystem walk, no SSHFS round-trips. The index is updated in
         # place each time a chapter is written.
+        version = self.series_index.version
+        cached = self._series_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # Hot loop over every chapter in the library: bind globals/methods to
+        # locals, and sort the names up front instead of via key lambdas.
+        # The fields are coerced here, so model_construct skips re-validating
+        # data we just built ourselves.
+        index = self.series_index.list_all()
+        chapter_info = ChapterInfo.model_construct
+        sort_key = natural_sort_key
         series_list: List[SeriesInfo] = []
-        for series_name, chapters_map in self.series_index.list_all().items():
-            chapters = [
-                ChapterInfo(
+        add_series = series_list.append
+        for series_name in sorted(index):
+            chapters_map = index[series_name]
+            chapters: List[ChapterInfo] = []
+            add_chapter = chapters.append
+            for ch_name in sorted(chapters_map, key=sort_key):
+                meta = chapters_map[ch_name]
+                add_chapter(chapter_info(
                     name=ch_name,
                     is_complete=bool(meta.get("is_complete")),
                     page_count=int(meta.get("page_count", 0)),
                     last_modified=meta.get("last_modified") or "",
-                )
-                for ch_name, meta in chapters_map.items()
-            ]
-            chapters.sort(key=lambda x: natural_sort_key(x.name))
-            series_list.append(SeriesInfo(name=series_name, chapters=chapters))
-        series_list.sort(key=lambda x: x.name)
+                ))
+            add_series(SeriesInfo.model_construct(name=series_name, chapters=chapters))
+        self._series_cache = (version, series_list)
         return series_list
 
+    def get_series_response(self, request: Request) -> Response:
+        version = self.series_index.version
+        etag = f'"series-{self._etag_epoch}-{version}"'
+        cached = self._series_body
+        if cached is None or cached[0] != version:
+            body = orjson.dumps([s.model_dump() for s in self.scan_series()])
+            # The library's largest response; gzip it once per index version.
+            cached = (version, body, gzip.compress(body, 6))
+            self._series_body = cached
+        return _cached_response(cached[1], etag, request, "application/json", cached[2])
+
+    def clear_cache(self):
+        """Drop every derived listing so the next request rereads the disk."""
+        self._series_cache = None
+        self._series_body = None
+        self._image_list_cache.clear()
+        self._chapter_list_cache.clear()
+        self._missing_chapters.clear()
+
+    def _remember_missing(self, series_name: str, chapter_name: str):
+        missing = self._missing_chapters
+        key = (series_name, chapter_name)
+        # Re-insert so dict order stays oldest-first.
+        missing.pop(key, None)
+        missing[key] = time.monotonic()
+        if len(missing) > MISSING_CHAPTER_CACHE_SIZE:
+            missing.pop(next(iter(missing)), None)
+
+    def _known_missing(self, series_name: str, chapter_name: str) -> bool:
+        seen = self._missing_chapters.get((series_name, chapter_name))
+        if seen is None:
+            return False
+        if time.monotonic() - seen < MISSING_CHAPTER_TTL_SECONDS:
+            return True
+        self._missing_chapters.pop((series_name, chapter_name), None)
+        return False
+
     def get_available_chapters(self, series_name: str) -> List[str]:
-        series_dir = self.downloads_dir / series_name
-        if not series_dir.exists():
+        series_path = os.path.join(self._downloads_str, series_name)
+        try:
+            mtime_ns = os.stat(series_path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
             return []
+        now = time.monotonic()
+        cached = self._chapter_list_cache.get(series_name)
+        if cached is not None and now - cached[0] < CHAPTER_LIST_TTL_SECONDS and cached[1] == mtime_ns:
+            return cached[2]
+
         chapters = []
-        for chapter_dir in series_dir.iterdir():
-            if chapter_dir.is_dir() and chapter_dir.name.startswith('chapter_'):
-                has_images = any(
-                    f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-                    for f in chapter_dir.iterdir()
-                )
-                if has_images:
-                    chapters.append(chapter_dir.name)
+        try:
+            with os.scandir(series_path) as series_it:
+                for chapter_entry in series_it:
+                    if not chapter_entry.name.startswith('chapter_') or not chapter_entry.is_dir():
+                        continue
+                    if self._has_images(chapter_entry.path):
+                        chapters.append(chapter_entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         chapters.sort(key=natural_sort_key)
+        self._chapter_list_cache[series_name] = (now, mtime_ns, chapters)
         return chapters
 
+    @staticmethod
+    def _has_images(chapter_path: str) -> bool:
+        # Stops at the first page; the context manager closes the dir handle
+        # even when we bail out early.
+        with os.scandir(chapter_path) as it:
+            for entry in it:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot == -1:
+                    continue
+                ext = name[dot:]
+                if (ext in IMAGE_EXTENSIONS or ext.lower() in IMAGE_EXTENSIONS) and entry.is_file():
+                    return True
+        return False
+
     def get_next_local_chapters(self, series_name: str, current_chapter: str, count: int = 2) -> List[str]:
         chapters = self.get_available_chapters(series_name)
         if not chapters:
             return []
-        chapter_name = f"chapter_{current_chapter}"
-        try:
-            current_idx = chapters.index(chapter_name)
-        except ValueError:
-            for idx, ch in enumerate(chapters):
-                if natural_sort_key(ch) >= natural_sort_key(chapter_name):
-                    current_idx = idx
-                    break
-            else:
-                return []
+        # `chapters` is sorted by natural_sort_key, so the first chapter at or
+        # after the requested one is a binary search away.
+        current_idx = bisect.bisect_left(
+            chapters, natural_sort_key(f"chapter_{current_chapter}"), key=natural_sort_key,
+        )
         return chapters[current_idx:current_idx + count]
 
+    def count_local_chapters_after(self, series_name: str, chapter: str) -> int:
+        chapters = self.get_available_chapters(series_name)
+        return len(chapters) - bisect.bisect_right(
+            chapters, natural_sort_key(f"chapter_{chapter}"), key=natural_sort_key,
+        )
+
     def extract_chapter_num_from_name(self, chapter_name: str) -> str:
         return chapter_name[len("chapter_"):] if chapter_name.startswith("chapter_") else chapter_name
 
     def get_image_files(self, chapter_dir: Path) -> List[str]:
-        files = [
-            p.name for p in chapter_dir.iterdir()
-            if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
-        ]
+        # One scandir pass; `entry.is_file()` answers from d_type, so no
+        # per-page stat and no Path object per file.
+        files = []
+        with os.scandir(chapter_dir) as it:
+            for entry in it:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot == -1:
+                    continue
+                # Pages are almost always lowercase already; only fold case
+                # when the exact suffix misses.
+                ext = name[dot:]
+                if ext not in IMAGE_EXTENSIONS and ext.lower() not in IMAGE_EXTENSIONS:
+                    continue
+                if entry.is_file():
+                    files.append(name)
         files.sort(key=natural_sort_key)
         return files
 
     def get_chapter_images(self, series_name: str, chapter_name: str) -> List[str]:
-        chapter_path = self.downloads_dir / series_name / chapter_name
-        if not chapter_path.exists():
+        return self._chapter_pages(series_name, chapter_name)[0]
+
+    def _chapter_pages(
+        self, series_name: str, chapter_name: str,
+    ) -> tuple[List[str], List[Optional[List[int]]]]:
+        """Image URLs and their [width, height] (None if unknown), cached
+        by chapter dir mtime so a repeat view costs one stat."""
+        if self._known_missing(series_name, chapter_name):
             raise FileNotFoundError(f"Chapter not found: {series_name}/{chapter_name}")
-        return [f"image/{series_name}/{chapter_name}/{f}" for f in self.get_image_files(chapter_path)]
+        chapter_path = self.downloads_dir / series_name / chapter_name
+        try:
+            mtime_ns = chapter_path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self._remember_missing(series_name, chapter_name)
+            raise FileNotFoundError(f"Chapter not found: {series_name}/{chapter_name}") from None
+        key = (series_name, chapter_name, mtime_ns)
+        cached = self._image_list_cache.get(key)
+        if cached is not None:
+            return cached
+        prefix = f"image/{series_name}/{chapter_name}/"
+        files = self.get_image_files(chapter_path)
+        dims = read_dimensions(chapter_path)
+        pages = ([prefix + f for f in files], [dims.get(f) for f in files])
+        cache = self._image_list_cache
+        cache[key] = pages
+        if len(cache) > IMAGE_LIST_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest.
+            cache.pop(next(iter(cache)), None)
+        return pages
 
     # ----- recents --------------------------------------------------------
 
     def load_recent_chapters(self) -> List[RecentChapter]:
+        return list(self._recent)
+
+    def get_recent_response(self, request: Request) -> Response:
+        version = self._recent_version
+        etag = f'"recent-{self._etag_epoch}-{version}"'
+        cached = self._recent_body
+        if cached is None or cached[0] != version:
+            cached = (version, orjson.dumps([r.model_dump() for r in self.load_recent_chapters()]))
+            self._recent_body = cached
+        return _cached_response(cached[1], etag, request, "application/json")
+
+    def _load_recent_from_disk(self) -> List[RecentChapter]:
         if not self.recent_file.exists():
             return []
         try:
-            with open(self.recent_file, 'r') as f:
-                data = json.load(f)
-            chapters = []
+            # Entries the model would reject anyway are dropped up front, so
+            # one bad last_read can't break the sort and lose every recent.
+            data = [
+                d for d in orjson.loads(self.recent_file.read_bytes())
+                if isinstance(d, dict)
+                and isinstance(d.get('series'), str)
+                and isinstance(d.get('last_read'), str)
+            ]
+            # Sort and dedup on the raw dicts so only the ≤10 survivors are
+            # turned into models.
+            data.sort(key=lambda d: d['last_read'], reverse=True)
+            kept: Dict[str, RecentChapter] = {}
             for item in data:
+                series = item.get('series')
+                if series in kept:
+                    continue
                 try:
-                    chapters.append(RecentChapter(**item))
+                    kept[series] = RecentChapter(**item)
                 except Exception:
                     continue
-            chapters.sort(key=lambda r: (r.last_read or ""), reverse=True)
-            deduped, seen = [], set()
-            for c in chapters:
-                if c.series not in seen:
-                    deduped.append(c)
-                    seen.add(c.series)
-            return deduped[:10]
+                if len(kept) == 10:
+                    break
+            return list(kept.values())
         except Exception:
             return []
 
     def save_recent_chapter(self, recent: RecentChapter):
-        recents = self.load_recent_chapters()
-        recents = [r for r in recents if r.series != recent.series]
-        recents.insert(0, recent)
-        recents.sort(key=lambda r: (r.last_read or ""), reverse=True)
-        recents = recents[:10]
+        """Update recents in memory; the file is written by flush_recent_chapters."""
+        with self._recent_lock:
+            recents = [r for r in self._recent if r.series != recent.series]
+            # The list is kept newest-first, so the new entry goes on top
+            # without a re-sort.
+            recents.insert(0, recent)
+            self._recent = recents[:10]
+            self._recent_dirty = True
+            self._recent_version += 1
+
+    def flush_recent_chapters(self):
+        with self._recent_lock:
+            if not self._recent_dirty:
+                return
+            recents = list(self._recent)
+            self._recent_dirty = False
         try:
             self.recent_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.recent_file, 'w') as f:
-                json.dump([r.model_dump() for r in recents], f, indent=2)
+            tmp = self.recent_file.with_suffix('.json.tmp')
+            tmp.write_bytes(orjson.dumps(
+                [r.model_dump() for r in recents], option=orjson.OPT_INDENT_2,
+            ))
+            os.replace(tmp, self.recent_file)
         except Exception as e:
             logger.error("Error saving recent chapters: %s", e)
+            self._recent_dirty = True
+
+    def _schedule_recent_flush(self):
+        if self._recent_flush_task is None or self._recent_flush_task.done():
+            self._recent_flush_task = asyncio.create_task(self._flush_recent_later())
+
+    async def _flush_recent_later(self):
+        # Loop so a save that lands while a write is in flight (which sees
+        # this task still running) gets its own flush too.
+        while True:
+            await asyncio.sleep(RECENT_FLUSH_DELAY_SECONDS)
+            await self._run_fs(self.flush_recent_chapters)
+            if not self._recent_dirty:
+                return
 
     # ----- templates ------------------------------------------------------
 
-    def get_reader_html(self) -> str:
-        return self.reader_template
+    def get_reader_response(self, request: Request) -> Response:
+        return _cached_response(
+            self.reader_template, self._reader_etag, request, "text/html", self._reader_gzip,
+        )
+
+    def get_home_response(self, request: Request) -> Response:
+        return _cached_response(
+            self.home_template, self._home_etag, request, "text/html", self._home_gzip,
+        )
+
+
+def _body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+
 
-    def get_home_html(self) -> str:
-        return self.home_template
+def _cached_response(
+    body: bytes, etag: str, request: Request, media_type: str, gzipped: Optional[bytes] = None,
+) -> Response:
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(gzipped, media_type=media_type, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
 
 
 def create_ripraven_router(downloads_dir: str | Path = "../data/ripraven/downloads") -> APIRouter:
@@ -11,7 +11,7 @@ import random
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Set
 
 from .scraper import CFScraper
 from .pattern_finder import ChapterListCache
@@ -45,8 +45,9 @@ async def _one_cycle(scraper: CFScraper,
                      tracking: TrackingState,
                      chapter_cache: ChapterListCache,
                      downloads_dir: Path,
-                     is_complete: Callable[[str, str], bool],
-                     series_index: SeriesIndex) -> int:
+                     completed_chapters: Callable[[str], Set[str]],
+                     series_index: SeriesIndex,
+                     on_chapter_written: Callable[[str, str], None]) -> int:
     """One pass over all tracked series; at most one chapter (or one chapter
     list) per series. Returns the number of work items completed."""
     done = 0
@@ -60,15 +61,18 @@ async def _one_cycle(scraper: CFScraper,
             logger.info("📚 cached %d chapters for %s", len(new), series_name)
             done += 1
             continue
+        completed = completed_chapters(series_name)
         for ch in chapters:
             ch_num = str(ch['number'])
-            if is_complete(series_name, ch_num):
+            if ch_num in completed:
                 continue
             logger.info("📥 fetching %s ch %s", series_name, ch_num)
-            chapter_dir = downloads_dir / series_name / f"chapter_{ch_num}"
+            chapter_name = f"chapter_{ch_num}"
+            chapter_dir = downloads_dir / series_name / chapter_name
             page_count = await scraper.fetch_chapter_pages(ch['url'], chapter_dir)
             (chapter_dir / "completed").write_text(datetime.now().isoformat())
-            series_index.update_chapter(series_name, f"chapter_{ch_num}", chapter_dir)
+            series_index.update_chapter(series_name, chapter_name, chapter_dir)
+            on_chapter_written(series_name, chapter_name)
             logger.info("✅ %s ch %s: %d pages on disk", series_name, ch_num, page_count)
             done += 1
             await asyncio.sleep(random.uniform(WORK_SLEEP_MIN_S, WORK_SLEEP_MAX_S))
@@ -87,8 +91,9 @@ async def run_worker(scraper: CFScraper,
                      tracking: TrackingState,
                      chapter_cache: ChapterListCache,
                      downloads_dir: Path,
-                     is_complete: Callable[[str, str], bool],
-                     series_index: SeriesIndex):
+                     completed_chapters: Callable[[str], Set[str]],
+                     series_index: SeriesIndex,
+                     on_chapter_written: Callable[[str, str], None]):
     logger.info("🦅 ripraven worker: starting")
     consecutive_failures = 0
     chapters_since_reset = 0
@@ -100,7 +105,8 @@ async def run_worker(scraper: CFScraper,
                 await asyncio.sleep(IDLE_SLEEP_S)
                 continue
 
-            done = await _one_cycle(scraper, tracking, chapter_cache, downloads_dir, is_complete, series_index)
+            done = await _one_cycle(scraper, tracking, chapter_cache, downloads_dir,
+                                    completed_chapters, series_index, on_chapter_written)
             consecutive_failures = 0
             if done:
                 chapters_since_reset += done